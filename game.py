@@ -10,21 +10,40 @@
 
 import random
 import json
-from enum import Enum, auto
+from array import array
+from enum import IntEnum, auto
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Optional, Dict, Any
+
+try:
+    import numpy as np # Optional, only used to speed up the number crunching. The game runs fine without it
+except ImportError:
+    np = None
+
+try:
+    import orjson # Optional C JSON encoder for the save system, falls back to the json module
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit # Optional as well, compiles the simulator below to machine code
+except ImportError:
+    def njit(*args, **kwargs): # Without numba the decorator does nothing and the simulator runs as plain Python
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # ==================== ENUMS ====================
 
-class GameState(Enum): #In c++ or any static language we can write enum class but here we need to import the Enum from enum library but we it still gets the work done 
+class GameState(IntEnum): #IntEnum so comparisons are plain int compares. In c++ or any static language we can write enum class but here we need to import the Enum from enum library but we it still gets the work done 
     BETTING = auto() #the auto function here automatically assigns values to the ENUM members after its position, 1, 2, 3 ...
     PLAYER_TURN = auto() #see the documentation on PyPi.org 
     DEALER_TURN = auto()
     ROUND_OVER = auto()
     GAME_OVER = auto() #Normally we would like to set this to False but it needs to be assigned at runtime since it is 'situational' 
 
-class RoundResult(Enum):
+class RoundResult(IntEnum):
     VICTORY = auto()
     LOSS = auto()
     TIE = auto()
@@ -33,87 +52,125 @@ class RoundResult(Enum):
 
 # ==================== CARD ====================
 
+RANK_VALUES = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10,
+               'J': 10, 'Q': 10, 'K': 10, #10, J, Q, K are all of value 10 by DEFAULT according to the BlackJack rules 
+               'A': 11} # Or 1 but we will handle the exception later on 
+
 class Card:
+    __slots__ = ('suit', 'rank', 'value', 'is_ace', '_str') # no per-instance __dict__, like a plain C struct
+    
     def __init__(self, suit: str, rank: str):
         self.suit = suit #Initialize our Card properties, these are suit & rank which are both of type string
         self.rank = rank
-    
-    @property                                         # Use of class attributes / decorators are preferred by the author 
-    def value(self) -> int:
-        if self.rank in ['J', 'Q', 'K']:
-            return 10       #10, J, Q, K are all of value 10 by DEFAULT according to the BlackJack rules 
-        elif self.rank == 'A':
-            return 11  # Or 1 but we will handle the exception later on 
-        return int(self.rank)
+        self.value = RANK_VALUES[rank] # A card never changes, so look the value up once instead of on every access
+        self.is_ace = rank == 'A'
+        self._str = f"{rank}{suit[0]}"
     
     def __str__(self):
-        return f"{self.rank}{self.suit[0]}" # Just STD behavior in terms of __str__ output, i.e. nothing special 
+        return self._str # Just STD behavior in terms of __str__ output, i.e. nothing special 
+
+# The deck and the hands don't store Card objects, they store a small card id (0-51) instead.
+# Everything we need to know about a card lives in these lookup tables, indexed by that id (struct-of-arrays, like a C lookup table)
+SUITS = ('Hearts', 'Diamonds', 'Clubs', 'Spades')
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+CARDS = tuple(Card(suit, rank) for suit in SUITS for rank in RANKS)
+CARD_VALUES = array('b', [card.value for card in CARDS]) # signed char per card, 52 bytes in total
+CARD_ACES = array('b', [card.is_ace for card in CARDS]) # 1 for aces, 0 for everything else, so counting aces is a plain add
+CARD_STRS = tuple(str(card) for card in CARDS)
+DECK_TEMPLATE = array('b', range(len(CARDS))) # one ordered 52 card deck, built once
+
+def _make_rng(seed: Optional[int] = None):
+    # Without a seed we draw one from the random module, so random.seed() still makes a game reproducible
+    if np is not None:
+        return np.random.default_rng(random.getrandbits(64) if seed is None else seed)
+    return random.Random(seed) if seed is not None else random
 
 # ==================== DECK ====================
 
 class Deck:
-    def __init__(self, num_decks: int = 6): #My teacher said it would be about six decks in the game, so set it to default 6, can be changed.
+    __slots__ = ('num_decks', 'cards', '_rng', '_next')
+    
+    def __init__(self, num_decks: int = 6, seed: Optional[int] = None): #My teacher said it would be about six decks in the game, so set it to default 6, can be changed.
         self.num_decks = num_decks
-        self.cards: List[Card] = [] #Simple array (Originally we were going to use a doubly linked list, but the author found it easier to implement an array-like Deck since it is only six decks of cards and not one thousand - so O(n) doesn't cause that much trouble 
+        self.cards = array('b') #Simple array (Originally we were going to use a doubly linked list, but the author found it easier to implement an array-like Deck since it is only six decks of cards and not one thousand - so O(n) doesn't cause that much trouble. Packed card ids, one byte per card instead of one Card object per card (312 bytes for six decks)
+        self._rng = _make_rng(seed) # numpy Generator if numpy is installed, otherwise random.Random or the random module itself
+        self._next = 0 # index of the next card to deal, the cards before it are already out of the shoe
         self._build_deck() # Method for constructing the deck, assign suit , rank etc.
         self.shuffle()  # Method for shuffling / mixing the cards 
     
     def _build_deck(self):
-        self.cards = []
-        for _ in range(self.num_decks):
-            for suit in ['Hearts', 'Diamonds', 'Clubs', 'Spades']:
-                for rank in ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']:
-                    self.cards.append(Card(suit, rank)) 
+        self.cards = DECK_TEMPLATE * self.num_decks # array repetition gives us a fresh copy, so shuffling never touches the template
     
     def shuffle(self):
-        random.shuffle(self.cards) #The use of the RANDOM Library API
+        if np is not None:
+            self._rng.shuffle(np.frombuffer(self.cards, dtype=np.int8)) # Shuffle the array in place through a numpy view, the whole Fisher-Yates runs in C
+        else:
+            self._rng.shuffle(self.cards) #The use of the RANDOM Library API, works on array.array just like on a list
+        self._next = 0
     
-    def draw(self) -> Card: #Return the Card type; 
-        if not self.cards:
-            self._build_deck() # Build the deck if self.cards doesn't already exist
+    def draw(self) -> int: #Return the card id, look it up in CARDS / CARD_VALUES / CARD_STRS
+        if self._next >= len(self.cards):
+            self._build_deck() # Rebuild the deck once every card has been dealt
             self.shuffle()
-        return self.cards.pop() 
+        card = self.cards[self._next] # Just move the cursor forward, the array itself is never resized
+        self._next += 1
+        return card
     
     def __len__(self):
-        return len(self.cards) # private logic method for len() 
+        return len(self.cards) - self._next # private logic method for len() 
 
 # ==================== HAND ====================
 
 class Hand:
+    __slots__ = ('cards', 'bet', '_raw_sum', '_ace_count', '_str_cache')
+    
     def __init__(self):
-        self.cards: List[Card] = [] 
+        self.cards = array('b') # card ids, see CARDS. Packed the same way as the deck
         self.bet: int = 0
+        self._raw_sum = 0 # running total with every ace counted as 11, kept up to date by add_card()
+        self._ace_count = 0
+        self._str_cache = '' # what __str__ returns, extended card by card so we never rebuild it
     
     @property
     def value(self) -> int:
-        value = sum(card.value for card in self.cards)
-        aces = sum(1 for card in self.cards if card.rank == 'A')
-        while value > 21 and aces > 0:
-            value -= 10
-            aces -= 1
-        return value
+        over = self._raw_sum - 21
+        if over <= 0 or self._ace_count == 0:
+            return self._raw_sum
+        return self._raw_sum - 10 * min(self._ace_count, (over + 9) // 10) # Count just enough aces as 1 to get back to 21 or below, no loop needed
+    
+    @property
+    def is_soft(self) -> bool:
+        return self.value > self._raw_sum - 10 * self._ace_count # at least one ace is still counted as 11
     
     @property
     def is_blackjack(self) -> bool:
-        return len(self.cards) == 2 and self.value == 21
+        return len(self.cards) == 2 and self._raw_sum == 21 # two cards can only make 21 as A + 10, so no ace adjustment needed
     
     @property
     def is_busted(self) -> bool:
         return self.value > 21
     
-    def add_card(self, card: Card):
+    def add_card(self, card: int):
         self.cards.append(card)
+        self._raw_sum += CARD_VALUES[card]
+        self._ace_count += CARD_ACES[card]
+        self._str_cache = f"{self._str_cache} {CARD_STRS[card]}" if self._str_cache else CARD_STRS[card]
     
     def clear(self):
-        self.cards.clear()
+        del self.cards[:] # array.array has no clear()
         self.bet = 0
+        self._raw_sum = 0
+        self._ace_count = 0
+        self._str_cache = ''
     
     def __str__(self):
-        return ' '.join(str(card) for card in self.cards)
+        return self._str_cache
 
 # ==================== PLAYER ====================
 
 class Player:
+    __slots__ = ('name', 'bankroll', 'hand')
+    
     def __init__(self, name: str, bankroll: int = 1000):
         self.name = name
         self.bankroll = bankroll
@@ -132,12 +189,30 @@ class Player:
     def __str__(self):
         return f"{self.name} (${self.bankroll})"
 
+# ==================== STRATEGY ====================
+
+STAND = 0 # Actions in a strategy table
+HIT = 1
+
+# Strategy tables are indexed as table[dealer_up_card_value - 2][player_value], i.e. 10 rows (2 - Ace) by 22 columns (0 - 21)
+# Precomputed once, so a decision is just two lookups instead of a pile of if statements
+# Basic strategy for a multi-deck shoe where the dealer stands on 17, hit / stand only since this game has no double or split
+BASIC_STRATEGY_HARD = tuple(
+    tuple(HIT if total <= 11 or (total == 12 and not 4 <= up_card <= 6) or (13 <= total <= 16 and up_card >= 7) else STAND
+          for total in range(22))
+    for up_card in range(2, 12))
+BASIC_STRATEGY_SOFT = tuple(
+    tuple(HIT if total <= 17 or (total == 18 and up_card >= 9) else STAND for total in range(22))
+    for up_card in range(2, 12))
+
 # ==================== MAIN GAME ====================
 
 class BlackjackGame:
     """ Class for the main game loop & logic, we need to specify num_decks and bets, edit num_decks after request
         In this class we will have a structured public: and private:, just like in C++ we keep heavy logic and calculations in the private section and the public section will contain the information / results of calculations
     """
+    __slots__ = ('deck', 'player', 'dealer_hand', 'min_bet', 'max_bet', 'game_state', 'round_result')
+    
     def __init__(self, num_decks: int = 6, min_bet: int = 10, max_bet: int = 500):
         self.deck = Deck(num_decks)
         self.player = Player("Player")
@@ -174,16 +249,16 @@ class BlackjackGame:
             self._handle_blackjack() 
     
     def _handle_blackjack(self):
-        if self.dealer_hand.cards[0].value >= 10:
+        if CARD_VALUES[self.dealer_hand.cards[0]] >= 10:
             if len(self.dealer_hand.cards) == 2 and self.dealer_hand.value == 21:
                 self.round_result = RoundResult.TIE
                 self.player.bankroll += self.player.hand.bet
             else:
                 self.round_result = RoundResult.BLACKJACK
-                self.player.bankroll += int(self.player.hand.bet * 2.5)
+                self.player.bankroll += self.player.hand.bet * 5 // 2 # 3:2 payout plus the bet back, integer only
         else:
             self.round_result = RoundResult.BLACKJACK
-            self.player.bankroll += int(self.player.hand.bet * 2.5)
+            self.player.bankroll += self.player.hand.bet * 5 // 2
         
         self.game_state = GameState.ROUND_OVER
     
@@ -205,6 +280,19 @@ class BlackjackGame:
         self._dealer_play()
         return True
     
+    def auto_play(self) -> bool: # Let basic strategy play the player's turn
+        if self.game_state != GameState.PLAYER_TURN:
+            return False
+        
+        up_card = CARD_VALUES[self.dealer_hand.cards[0]] - 2
+        while self.game_state == GameState.PLAYER_TURN:
+            table = BASIC_STRATEGY_SOFT if self.player.hand.is_soft else BASIC_STRATEGY_HARD
+            if table[up_card][self.player.hand.value] == HIT:
+                self.hit()
+            else:
+                self.stand()
+        return True
+    
     def _dealer_play(self):
         self.game_state = GameState.DEALER_TURN
         
@@ -249,12 +337,198 @@ class BlackjackGame:
             'player_value': self.player.hand.value,
             'dealer_hand': str(self.dealer_hand),
             'dealer_value': self.dealer_hand.value,
-            'dealer_up_card': str(self.dealer_hand.cards[0]) if self.dealer_hand.cards else None,
+            'dealer_up_card': CARD_STRS[self.dealer_hand.cards[0]] if self.dealer_hand.cards else None,
             'can_hit': self.game_state == GameState.PLAYER_TURN and not self.player.hand.is_busted,
             'can_stand': self.game_state == GameState.PLAYER_TURN,
             'deck_size': len(self.deck)
         }
 
+# ==================== SIMULATION ====================
+
+_MAX_ROUND_CARDS = 39 # Worst case for one round: the player can hold 22 cards before busting and the dealer 17 before standing
+
+@njit(cache=True)
+def _hand_value(raw_sum, aces):
+    over = raw_sum - 21
+    if over <= 0 or aces == 0:
+        return raw_sum
+    return raw_sum - 10 * min(aces, (over + 9) // 10) # Same closed form as Hand.value
+
+@njit(cache=True)
+def _play_shoe(values, hard_strategy, soft_strategy, bet, deltas, start, cut):
+    """ Plays rounds from one shuffled shoe of card values (not ids) until the cut card or until deltas is full,
+        writes the bankroll change of every round into deltas and returns the index of the next round to play.
+        Same rules as BlackjackGame, only with plain ints instead of objects so numba can compile it
+    """
+    i = 0
+    n = start
+    while n < len(deltas) and i <= cut:
+        player_sum = 0
+        player_aces = 0
+        dealer_sum = 0
+        dealer_aces = 0
+        for k in range(4): # Player, dealer, player, dealer, just like _start_round
+            card = int(values[i])
+            i += 1
+            if k % 2 == 0:
+                player_sum += card
+                if card == 11:
+                    player_aces += 1
+            else:
+                dealer_sum += card
+                if card == 11:
+                    dealer_aces += 1
+        up_card = int(values[i - 3])
+        
+        if player_sum == 21: # Blackjack, see _handle_blackjack
+            deltas[n] = 0 if dealer_sum == 21 else bet * 3 // 2
+            n += 1
+            continue
+        
+        player_value = _hand_value(player_sum, player_aces)
+        while True: # Player turn
+            if player_value > player_sum - 10 * player_aces: # Soft hand, an ace still counts as 11
+                action = soft_strategy[up_card - 2][player_value]
+            else:
+                action = hard_strategy[up_card - 2][player_value]
+            if action != HIT:
+                break
+            card = int(values[i])
+            i += 1
+            player_sum += card
+            if card == 11:
+                player_aces += 1
+            player_value = _hand_value(player_sum, player_aces)
+            if player_value > 21:
+                break
+        
+        if player_value > 21:
+            deltas[n] = -bet
+            n += 1
+            continue
+        
+        dealer_value = _hand_value(dealer_sum, dealer_aces)
+        while dealer_value < 17: # Game AI, see _dealer_play
+            card = int(values[i])
+            i += 1
+            dealer_sum += card
+            if card == 11:
+                dealer_aces += 1
+            dealer_value = _hand_value(dealer_sum, dealer_aces)
+        
+        if dealer_value > 21 or player_value > dealer_value:
+            deltas[n] = bet
+        elif player_value < dealer_value:
+            deltas[n] = -bet
+        else:
+            deltas[n] = 0
+        n += 1
+    return n
+
+def simulate_rounds(n_rounds: int, hard_strategy=BASIC_STRATEGY_HARD, soft_strategy=BASIC_STRATEGY_SOFT, num_decks: int = 6, bet: int = 10, seed: Optional[int] = None):
+    """ Plays n_rounds of blackjack automatically with the given strategy tables (hard and soft hands) and returns the bankroll change of every round.
+        Meant for Monte-Carlo style experiments (e.g. the expected value of a strategy), the interactive game still uses BlackjackGame.
+        Pass a seed to get the same rounds every time
+    """
+    deck = Deck(num_decks, seed)
+    if np is not None:
+        card_values = np.frombuffer(CARD_VALUES, dtype=np.int8)
+        hard_table = np.array(hard_strategy, dtype=np.int8)
+        soft_table = np.array(soft_strategy, dtype=np.int8)
+        deltas = np.zeros(n_rounds, dtype=np.int64)
+    else:
+        hard_table = hard_strategy
+        soft_table = soft_strategy
+        deltas = array('q', bytes(8 * n_rounds))
+    
+    cut = len(deck.cards) - _MAX_ROUND_CARDS
+    done = 0
+    while done < n_rounds: # One shoe per iteration, reshuffle when the cut card comes out
+        deck.shuffle()
+        if np is not None:
+            values = card_values[np.frombuffer(deck.cards, dtype=np.int8)]
+        else:
+            values = array('b', [CARD_VALUES[card] for card in deck.cards])
+        done = _play_shoe(values, hard_table, soft_table, bet, deltas, done, cut)
+    return deltas
+
+def _hand_values(raw_sums, aces): # Hand.value for whole numpy arrays of hands at once
+    demote = np.minimum(aces, np.maximum(0, (raw_sums - 21 + 9) // 10))
+    return raw_sums - 10 * demote
+
+def simulate_batch(n_shoes: int, hard_strategy=BASIC_STRATEGY_HARD, soft_strategy=BASIC_STRATEGY_SOFT, num_decks: int = 6, bet: int = 10, seed: Optional[int] = None):
+    """ Plays n_shoes freshly shuffled shoes side by side with numpy, one round of every shoe per step, until each shoe reaches its cut card.
+        Returns two arrays: the total bankroll change of every shoe and the number of rounds played in it. Needs numpy, pass a seed to get the same shoes every time
+    """
+    if np is None:
+        raise ImportError("simulate_batch needs numpy, use simulate_rounds instead")
+    
+    rng = _make_rng(seed)
+    template = np.tile(np.frombuffer(CARD_VALUES, dtype=np.int8), num_decks)
+    batch = np.broadcast_to(template, (n_shoes, len(template))).copy()
+    rng.permuted(batch, axis=1, out=batch) # Every row is shuffled on its own
+    hard_table = np.array(hard_strategy, dtype=np.int8)
+    soft_table = np.array(soft_strategy, dtype=np.int8)
+    
+    cut = len(template) - _MAX_ROUND_CARDS
+    cursors = np.zeros(n_shoes, dtype=np.int64)
+    totals = np.zeros(n_shoes, dtype=np.int64)
+    rounds = np.zeros(n_shoes, dtype=np.int64)
+    shoes = np.arange(n_shoes)
+    
+    while True:
+        rows = shoes[cursors <= cut] # Shoes that still have a round left in them
+        if len(rows) == 0:
+            break
+        cursor = cursors[rows]
+        
+        dealt = batch[rows[:, None], cursor[:, None] + np.arange(4)].astype(np.int64) # Player, dealer, player, dealer
+        cursor += 4
+        player_sum = dealt[:, 0] + dealt[:, 2]
+        player_aces = (dealt[:, 0] == 11).astype(np.int64) + (dealt[:, 2] == 11)
+        dealer_sum = dealt[:, 1] + dealt[:, 3]
+        dealer_aces = (dealt[:, 1] == 11).astype(np.int64) + (dealt[:, 3] == 11)
+        up_card = dealt[:, 1] - 2
+        blackjack = player_sum == 21
+        
+        player_value = _hand_values(player_sum, player_aces)
+        playing = ~blackjack
+        while True: # Player turn, every shoe that still wants a card draws one
+            soft = player_value > player_sum - 10 * player_aces
+            index = np.minimum(player_value, 21)
+            action = np.where(soft, soft_table[up_card, index], hard_table[up_card, index])
+            playing &= action == HIT
+            if not playing.any():
+                break
+            card = batch[rows[playing], cursor[playing]].astype(np.int64)
+            cursor[playing] += 1
+            player_sum[playing] += card
+            player_aces[playing] += card == 11
+            player_value = _hand_values(player_sum, player_aces)
+            playing &= player_value <= 21
+        busted = player_value > 21
+        
+        dealer_value = _hand_values(dealer_sum, dealer_aces)
+        dealing = ~blackjack & ~busted
+        while True: # Game AI, see _dealer_play
+            dealing &= dealer_value < 17
+            if not dealing.any():
+                break
+            card = batch[rows[dealing], cursor[dealing]].astype(np.int64)
+            cursor[dealing] += 1
+            dealer_sum[dealing] += card
+            dealer_aces[dealing] += card == 11
+            dealer_value = _hand_values(dealer_sum, dealer_aces)
+        
+        delta = np.select(
+            [blackjack & (dealer_sum == 21), blackjack, busted, dealer_value > 21, player_value > dealer_value, player_value < dealer_value],
+            [0, bet * 3 // 2, -bet, bet, bet, -bet],
+            0)
+        totals[rows] += delta
+        rounds[rows] += 1
+        cursors[rows] = cursor
+    return totals, rounds
+
 # ==================== SIMPLE SAVE SYSTEM ====================
 
 class SaveSystem:
@@ -264,8 +538,9 @@ class SaveSystem:
         self.save_dir.mkdir(exist_ok=True)
     
     def save_game(self, player: Player, filename: str = None) -> str:
+        now = datetime.now() # Read the clock once so the filename and save_date always agree
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"blackjack_{timestamp}.json"
         
         save_path = self.save_dir / filename
@@ -273,11 +548,14 @@ class SaveSystem:
         save_data = {
             'player_name': player.name,
             'bankroll': player.bankroll,
-            'save_date': datetime.now().isoformat()
+            'save_date': now.isoformat()
         }
         
-        with open(save_path, 'w', encoding='utf-8') as f: # -r-xx-w write permission for the file, specify UTF-8
-            json.dump(save_data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(save_data, option=orjson.OPT_INDENT_2) # orjson always outputs UTF-8 bytes
+        else:
+            payload = json.dumps(save_data, indent=2).encode('utf-8')
+        save_path.write_bytes(payload) # Serialize in memory first, then write the whole file in one go
         
         return str(save_path)
 
@@ -290,12 +568,12 @@ def main(): #Since the author codes in C++ and Rust he will implement a main() f
     print("=== Blackjack Game ===")
     
     while game.player.bankroll > game.min_bet:
-        info = game.get_game_info()
+        state = game.game_state # Only read what each branch prints, get_game_info() builds the whole dictionary every time
         
-        if info['game_state'] == GameState.BETTING:
+        if state == GameState.BETTING:
             print(f"\n--- Round Start ---")
-            print(f"Bankroll: ${info['player_bankroll']}")
-            print(f"Cards remaining: {info['deck_size']}")
+            print(f"Bankroll: ${game.player.bankroll}")
+            print(f"Cards remaining: {len(game.deck)}")
             
             bet_input = input(f"Enter bet amount (${game.min_bet}-${game.max_bet}): ").strip()
             try:
@@ -307,12 +585,12 @@ def main(): #Since the author codes in C++ and Rust he will implement a main() f
             except ValueError:
                 print("Please enter a valid number")
         
-        elif info['game_state'] == GameState.PLAYER_TURN:
+        elif state == GameState.PLAYER_TURN:
             print(f"\n--- Your Turn ---")
-            print(f"Your hand: {info['player_hand']} (Value: {info['player_value']})")
-            print(f"Dealer shows: {info['dealer_up_card']}")
+            print(f"Your hand: {game.player.hand} (Value: {game.player.hand.value})")
+            print(f"Dealer shows: {CARD_STRS[game.dealer_hand.cards[0]]}")
             
-            if info['can_hit']:
+            if not game.player.hand.is_busted:
                 action = input("(h)it or (s)tand? ").lower()
                 if action == 'h':
                     game.hit()
@@ -323,12 +601,12 @@ def main(): #Since the author codes in C++ and Rust he will implement a main() f
             else:
                 game.stand()
         
-        elif info['game_state'] == GameState.ROUND_OVER:
+        elif state == GameState.ROUND_OVER:
             print(f"\n--- Round Over ---")
-            print(f"Your hand: {info['player_hand']} ({info['player_value']})")
-            print(f"Dealer hand: {info['dealer_hand']} ({info['dealer_value']})")
-            print(f"Result: {info['round_result'].name}")
-            print(f"New Bankroll: ${info['player_bankroll']}")
+            print(f"Your hand: {game.player.hand} ({game.player.hand.value})")
+            print(f"Dealer hand: {game.dealer_hand} ({game.dealer_hand.value})")
+            print(f"Result: {game.round_result.name}")
+            print(f"New Bankroll: ${game.player.bankroll}")
             
             if input("Save game? (y/n): ").lower() == 'y':
                 save_path = save_system.save_game(game.player)